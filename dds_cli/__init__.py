@@ -15,6 +15,17 @@ __author__ = "SciLifeLab Data Centre"
 __author_email__ = "datacentre@scilifelab.se"
 __license__ = "MIT"
 
+###############################################################################
+# VARIABLES ####################################################### VARIABLES #
+###############################################################################
+
+# All methods available in the DDS
+DDS_METHODS = frozenset(["put", "get", "ls", "rm"])
+
+# Methods which require a local directory, the project keys and a S3 connection
+DDS_DIR_REQUIRED_METHODS = frozenset(["put", "get"])
+DDS_KEYS_REQUIRED_METHODS = frozenset(["put", "get"])
+
 ###############################################################################
 # CLASSES ########################################################### CLASSES #
 ###############################################################################
@@ -8,6 +8,7 @@
 import concurrent.futures
 import itertools
 import logging
+import logging.handlers
 import os
 import pathlib
 import sys
@@ -90,7 +91,14 @@ def dds_main(ctx, verbose, log_file):
             log_fh.setFormatter(
                 logging.Formatter("[%(asctime)s] %(name)-20s [%(levelname)-7s]  %(message)s")
             )
-            LOG.addHandler(log_fh)
+
+            # Buffer the records to not write to the file for each one. The buffer is
+            # written when full, on warnings and errors, and when logging shuts down
+            log_mh = logging.handlers.MemoryHandler(
+                capacity=1024, flushLevel=logging.WARNING, target=log_fh
+            )
+            log_mh.setLevel(logging.DEBUG)
+            LOG.addHandler(log_mh)
 
         # Check that the config file exists
         config_file = None
@@ -209,7 +217,11 @@ def put(
             num_threads,
             silent,
         )
-    except (dds_cli.exceptions.AuthenticationError, dds_cli.exceptions.UploadError) as e:
+    except (
+        dds_cli.exceptions.APIError,
+        dds_cli.exceptions.AuthenticationError,
+        dds_cli.exceptions.UploadError,
+    ) as e:
         LOG.error(e)
         sys.exit(1)
 
@@ -386,12 +398,12 @@ def rm(dds_info, proj_arg, project, username, rm_all, file, folder, config):
     # One of proj_arg or project is required
     if all(x is None for x in [proj_arg, project]):
         LOG.error("No project specified, cannot remove anything.")
-        os._exit(1)
+        dds_cli.utils.exit_now(1)
 
     # Either all or a file
     if rm_all and (file or folder):
         LOG.error("The options '--rm-all' and '--file'/'--folder' cannot be used together.")
-        os._exit(1)
+        dds_cli.utils.exit_now(1)
 
     project = proj_arg if proj_arg is not None else project
 
@@ -400,7 +412,7 @@ def rm(dds_info, proj_arg, project, username, rm_all, file, folder, config):
         LOG.error(
             "One of the options must be specified to perform data deletion: '--rm-all' / '--file' / '--folder'."
         )
-        os._exit(1)
+        dds_cli.utils.exit_now(1)
 
     # Warn if trying to remove all contents
     if rm_all:
@@ -408,7 +420,7 @@ def rm(dds_info, proj_arg, project, username, rm_all, file, folder, config):
             f"Are you sure you want to delete all files within project '{project}'?"
         ):
             LOG.info("Probably for the best. Exiting.")
-            os._exit(0)
+            dds_cli.utils.exit_now(0)
 
     with dds_cli.data_remover.DataRemover(
         project=project,
@@ -537,83 +549,91 @@ def get(
         LOG.error(
             "Flag '--get-all' cannot be used together with options '--source'/'--source-path-fail'."
         )
-        os._exit(1)
+        dds_cli.utils.exit_now(1)
 
     # Begin delivery
-    with dds_cli.data_getter.DataGetter(
-        username=username,
-        config=dds_info["CONFIG"] if config is None else config,
-        project=project,
-        get_all=get_all,
-        source=source,
-        source_path_file=source_path_file,
-        break_on_fail=break_on_fail,
-        destination=destination,
-        silent=silent,
-        verify_checksum=verify_checksum,
-    ) as getter:
-
-        with Progress(
-            "{task.description}",
-            BarColumn(bar_width=None),
-            " • ",
-            "[progress.percentage]{task.percentage:>3.1f}%",
-            refresh_per_second=2,
-            console=dds_cli.utils.console,
-        ) as progress:
-
-            # Keep track of futures
-            download_threads = {}
-
-            # Iterator to keep track of which files have been handled
-            iterator = iter(getter.filehandler.data.copy())
-
-            with concurrent.futures.ThreadPoolExecutor() as texec:
-                task_dwnld = progress.add_task(
-                    "Download", total=len(getter.filehandler.data), step="summary"
-                )
-
-                # Schedule the first num_threads futures for upload
-                for file in itertools.islice(iterator, num_threads):
-                    LOG.info(f"Starting: {file}")
-                    # Execute download
-                    download_threads[
-                        texec.submit(getter.download_and_verify, file=file, progress=progress)
-                    ] = file
-
-                while download_threads:
-                    # Wait for the next future to complete
-                    ddone, _ = concurrent.futures.wait(
-                        download_threads, return_when=concurrent.futures.FIRST_COMPLETED
-                    )
+    try:
+        with dds_cli.data_getter.DataGetter(
+            username=username,
+            config=dds_info["CONFIG"] if config is None else config,
+            project=project,
+            get_all=get_all,
+            source=source,
+            source_path_file=source_path_file,
+            break_on_fail=break_on_fail,
+            destination=destination,
+            silent=silent,
+            verify_checksum=verify_checksum,
+        ) as getter:
+
+            with Progress(
+                "{task.description}",
+                BarColumn(bar_width=None),
+                " • ",
+                "[progress.percentage]{task.percentage:>3.1f}%",
+                refresh_per_second=2,
+                console=dds_cli.utils.console,
+            ) as progress:
 
-                    new_tasks = 0
+                # Keep track of futures
+                download_threads = {}
 
-                    for dfut in ddone:
-                        downloaded_file = download_threads.pop(dfut)
-                        LOG.info(
-                            f"Future done: {downloaded_file}",
-                        )
+                # Iterator to keep track of which files have been handled
+                iterator = iter(getter.filehandler.data.copy())
 
-                        # Get result
-                        try:
-                            file_downloaded = dfut.result()
-                            LOG.info(f"Download of {downloaded_file} successful: {file_downloaded}")
-                        except concurrent.futures.BrokenExecutor as err:
-                            LOG.critical(f"Download of file {downloaded_file} failed! Error: {err}")
-                            continue
-
-                        new_tasks += 1
-                        progress.advance(task_dwnld)
-
-                    # Schedule the next set of futures for download
-                    for next_file in itertools.islice(iterator, new_tasks):
-                        LOG.info(f"Starting: {next_file}")
+                with concurrent.futures.ThreadPoolExecutor() as texec:
+                    task_dwnld = progress.add_task(
+                        "Download", total=len(getter.filehandler.data), step="summary"
+                    )
+
+                    # Schedule the first num_threads futures for upload
+                    for file in itertools.islice(iterator, num_threads):
+                        LOG.info("Starting: %s", file)
                         # Execute download
                         download_threads[
-                            texec.submit(
-                                getter.download_and_verify,
-                                file=next_file,
-                                progress=progress,
-                            )
-                        ] = next_file
+                            texec.submit(getter.download_and_verify, file=file, progress=progress)
+                        ] = file
+
+                    while download_threads:
+                        # Wait for the next future to complete
+                        ddone, _ = concurrent.futures.wait(
+                            download_threads, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+
+                        new_tasks = 0
+
+                        for dfut in ddone:
+                            downloaded_file = download_threads.pop(dfut)
+                            LOG.info("Future done: %s", downloaded_file)
+
+                            # Get result
+                            try:
+                                file_downloaded = dfut.result()
+                                LOG.info(
+                                    "Download of %s successful: %s",
+                                    downloaded_file,
+                                    file_downloaded,
+                                )
+                            except concurrent.futures.BrokenExecutor as err:
+                                LOG.critical(
+                                    "Download of file %s failed! Error: %s", downloaded_file, err
+                                )
+                                continue
+
+                            new_tasks += 1
+                            progress.advance(task_dwnld)
+
+                        # Schedule the next set of futures for download
+                        for next_file in itertools.islice(iterator, new_tasks):
+                            LOG.info("Starting: %s", next_file)
+                            # Execute download
+                            download_threads[
+                                texec.submit(
+                                    getter.download_and_verify,
+                                    file=next_file,
+                                    progress=progress,
+                                )
+                            ] = next_file
+    except (dds_cli.exceptions.APIError, dds_cli.exceptions.AuthenticationError) as e:
+        LOG.error(e)
+        sys.exit(1)
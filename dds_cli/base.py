@@ -5,17 +5,17 @@
 ###############################################################################
 
 # Standard library
+import concurrent.futures
 import inspect
 import logging
-import os
+import operator
 import pathlib
-import traceback
 
 # Installed
 import getpass
+import orjson
 import requests
 import rich
-import simplejson
 
 # Own modules
 import dds_cli.directory
@@ -23,6 +23,7 @@ import dds_cli.timestamp
 import dds_cli.utils
 
 from dds_cli import DDSEndpoint
+from dds_cli import DDS_METHODS, DDS_DIR_REQUIRED_METHODS, DDS_KEYS_REQUIRED_METHODS
 from dds_cli import file_handler as fh
 from dds_cli import s3_connector as s3
 from dds_cli import user
@@ -55,12 +56,12 @@ class DDSBaseClass:
 
         # Get attempted operation e.g. put/ls/rm/get
         self.method = method
-        if self.method not in ["put", "get", "ls", "rm"]:
+        if self.method not in DDS_METHODS:
             raise exceptions.InvalidMethodError(attempted_method=self.method)
         LOG.debug(f"Attempted operation: {self.method}")
 
         # Use user defined festination if any specified
-        if self.method in ["get", "put"]:
+        if self.method in DDS_DIR_REQUIRED_METHODS:
             self.dds_directory = dds_cli.directory.DDSDirectory(
                 path=dds_directory
                 if dds_directory
@@ -71,6 +72,16 @@ class DDSBaseClass:
         # Keyboardinterrupt
         self.stop_doing = False
 
+        # Set when '--break-on-fail' has cancelled the remaining files
+        self.cancelled_all = False
+
+        # Reuse the connection to the API for all requests, e.g. one per file
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        )
+        self.s3connector = None
+
         # Verify that user entered enough info
         username, password, self.project = self.__verify_input(
             username=username,
@@ -83,16 +94,27 @@ class DDSBaseClass:
         dds_user = user.User(username=username, password=password, project=self.project)
         self.token = dds_user.token
 
+        # The token is sent with all requests made via the session
+        self.session.headers.update(self.token)
+
         LOG.debug(f"Method: {self.method}, Project: {self.project}")
         # Project access only required if trying to upload, download or list
         # files within project
-        if self.method in ["put", "get"] or (
-            self.method in ["ls", "rm"] and self.project is not None
-        ):
+        if self.method in DDS_KEYS_REQUIRED_METHODS or self.project is not None:
             self.token = self.__verify_project_access()
+            self.session.headers.update(self.token)
 
-            if self.method in ["put", "get"]:
-                self.keys = self.__get_project_keys()
+            if self.method in DDS_KEYS_REQUIRED_METHODS:
+                # Close the API connection if the keys cannot be retrieved
+                try:
+                    self.keys = self.__get_project_keys()
+                except (exceptions.APIError, exceptions.AuthenticationError):
+                    self.close()
+                    raise
+
+                # Connect to S3 once - the connection is shared by all files
+                self.s3connector = s3.S3Connector(project_id=self.project, token=self.token)
+                self.s3connector.__enter__()
 
                 self.status = dict()
                 self.filehandler = None
@@ -102,11 +124,14 @@ class DDSBaseClass:
 
     def __exit__(self, exc_type, exc_value, tb, max_fileerrs: int = 40):
 
+        # Close the API and S3 connections
+        self.close()
+
         # Don't clean up if we hit an exception
         if exc_type is not None:
             return False
 
-        if self.method in ["put", "get"]:
+        if self.method in DDS_KEYS_REQUIRED_METHODS:
             self.__printout_delivery_summary()
 
         return True
@@ -140,11 +165,11 @@ class DDSBaseClass:
         LOG.debug(f"Username: {username}, Project ID: {project}")
 
         # Username and project info is minimum required info
-        if self.method in ["put", "get"] and not project:
+        if self.method in DDS_KEYS_REQUIRED_METHODS and not project:
             dds_cli.utils.console.print(
                 "\n:warning: Data Delivery System project information is missing. :warning:\n"
             )
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         if not username:
             raise exceptions.MissingCredentialsException(missing="username")
@@ -165,10 +190,9 @@ class DDSBaseClass:
 
         # Perform request to API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.AUTH_PROJ,
                 params={"method": self.method},
-                headers=self.token,
                 timeout=DDSEndpoint.TIMEOUT,
             )
         except requests.exceptions.RequestException as err:
@@ -180,17 +204,17 @@ class DDSBaseClass:
             dds_cli.utils.console.print(
                 f"\n:no_entry_sign: Project access denied: {response.text} :no_entry_sign:\n"
             )
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         try:
-            dds_access = response.json()
-        except simplejson.JSONDecodeError as err:
+            dds_access = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         # Access not granted
         if not dds_access["dds-access-granted"] or "token" not in dds_access:
             dds_cli.utils.console.print("\n:no_entry_sign: Project access denied :no_entry_sign:\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         LOG.debug(f"User has been granted access to project {self.project}")
 
@@ -200,12 +224,15 @@ class DDSBaseClass:
         """Get public and private project keys depending on method."""
 
         # Project public key required for both put and get
-        public = self.__get_key()
+        if self.method != "get":
+            return None, self.__get_key()
 
-        # Project private only required for get
-        private = self.__get_key(private=True) if self.method == "get" else None
+        # Project private only required for get - fetch both keys concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as texec:
+            public = texec.submit(self.__get_key)
+            private = texec.submit(self.__get_key, private=True)
 
-        return private, public
+            return private.result(), public.result()
 
     def __get_key(self, private: bool = False):
         """Get public key for project."""
@@ -213,33 +240,26 @@ class DDSBaseClass:
         key_type = "private" if private else "public"
         # Get key from API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.PROJ_PRIVATE if private else DDSEndpoint.PROJ_PUBLIC,
-                headers=self.token,
                 timeout=DDSEndpoint.TIMEOUT,
             )
         except requests.exceptions.RequestException as err:
-            LOG.fatal(str(err))
-            raise SystemExit from err
+            raise exceptions.APIError(f"Failed to get the {key_type} project key: {err}") from err
 
         if not response.ok:
-            dds_cli.utils.console.print(
-                f"\n:no_entry_sign: Project access denied: No {key_type} key. {response.text} :no_entry_sign:\n"
+            raise exceptions.AuthenticationError(
+                f"Project access denied: No {key_type} key. {response.text}"
             )
-            os._exit(1)
 
         # Get key from response
         try:
-            project_public = response.json()
-        except simplejson.JSONDecodeError as err:
-            LOG.fatal(str(err))
-            raise SystemExit from err
+            project_public = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
+            raise exceptions.APIError(f"Failed to get the {key_type} project key: {err}") from err
 
         if key_type not in project_public:
-            dds_cli.utils.console.print(
-                "\n:no_entry_sign: Project access denied: No {key_type} key. :no_entry_sign:\n"
-            )
-            os._exit(1)
+            raise exceptions.AuthenticationError(f"Project access denied: No {key_type} key.")
 
         return project_public[key_type]
 
@@ -310,33 +330,27 @@ class DDSBaseClass:
     def __collect_all_failed(self, sort: bool = True):
         """Put cancelled files from status in to failed dict and sort the output."""
 
-        # Transform all items to string
-        self.filehandler.data = {
-            str(file): {str(x): str(y) for x, y in info.items()}
-            for file, info in list(self.filehandler.data.items())
-        }
-        self.status = {
-            str(file): {str(x): str(y) for x, y in info.items()}
-            for file, info in list(self.status.items())
-        }
-
-        # Get cancelled files
+        # Nothing to collect or transform if all files were delivered
+        if not self.filehandler.failed and not any(x["cancel"] for x in self.status.values()):
+            return [] if sort else self.filehandler.failed
+
+        # Get cancelled files - only their info is transformed to string
         self.filehandler.failed.update(
             {
-                file: {
-                    **info,
-                    "message": self.status[file]["message"],
-                    "failed_op": self.status[file]["failed_op"],
+                str(file): {
+                    **{str(x): str(y) for x, y in info.items()},
+                    "message": str(self.status[file]["message"]),
+                    "failed_op": str(self.status[file]["failed_op"]),
                 }
                 for file, info in self.filehandler.data.items()
-                if self.status[file]["cancel"] in [True, "True"]
+                if self.status[file]["cancel"]
             }
         )
 
         # Sort by which directory the files are in
         return (
             sorted(
-                sorted(self.filehandler.failed.items(), key=lambda g: g[0]),
+                sorted(self.filehandler.failed.items(), key=operator.itemgetter(0)),
                 key=lambda f: f[1]["subpath"],
             )
             if sort
@@ -344,22 +358,32 @@ class DDSBaseClass:
         )
 
     # Public methods ################################# Public methods #
+    def close(self):
+        """Close the API connection and the shared S3 connection."""
+
+        # Any exception is handled by the caller - it did not happen in the S3 connection
+        if self.s3connector is not None:
+            self.s3connector.__exit__(None, None, None)
+            self.s3connector = None
+
+        self.session.close()
+
     def verify_bucket_exist(self):
         """Check that s3 connection works, and that bucket exists."""
 
         LOG.debug("Verifying and/or creating bucket.")
 
-        with s3.S3Connector(project_id=self.project, token=self.token) as conn:
+        conn = self.s3connector
 
-            if None in [conn.safespring_project, conn.keys, conn.bucketname, conn.url]:
-                dds_cli.utils.console.print(f"\n:warning: {conn.message} :warning:\n")
-                os._exit(1)
+        if None in [conn.safespring_project, conn.keys, conn.bucketname, conn.url]:
+            dds_cli.utils.console.print(f"\n:warning: {conn.message} :warning:\n")
+            dds_cli.utils.exit_now(1)
 
-            bucket_exists = conn.check_bucket_exists()
-            LOG.debug(f"Bucket exists: {bucket_exists}")
-            if not bucket_exists:
-                LOG.debug("Attempting to create bucket...")
-                _ = conn.create_bucket()
+        bucket_exists = conn.check_bucket_exists()
+        LOG.debug(f"Bucket exists: {bucket_exists}")
+        if not bucket_exists:
+            LOG.debug("Attempting to create bucket...")
+            _ = conn.create_bucket()
 
         LOG.debug("Bucket verified.")
 
@@ -54,26 +54,28 @@ def verify_proceed(func):
 
         # Mark as started
         self.status[file]["started"] = True
-        LOG.info(f"File {file} started {func.__name__}")
+        LOG.info("File %s started %s", file, func.__name__)
 
         # Run function
         ok_to_proceed, message = func(self, file=file, *args, **kwargs)
 
         # Cancel file(s) if something failed
         if not ok_to_proceed:
-            LOG.warning(f"{func.__name__} failed: {message}")
+            LOG.warning("%s failed: %s", func.__name__, message)
             self.status[file].update({"cancel": True, "message": message})
             if self.status[file].get("failed_op") is None:
                 self.status[file]["failed_op"] = "crypto"
 
-            if self.break_on_fail:
+            # The non-started files only need to be cancelled by the first failure
+            if self.break_on_fail and not self.cancelled_all:
+                self.cancelled_all = True
                 message = f"'--break-on-fail'. File causing failure: '{file}'. "
                 LOG.info(message)
 
                 _ = [
-                    self.status[x].update({"cancel": True, "message": message})
-                    for x in self.status
-                    if not self.status[x]["cancel"] and not self.status[x]["started"] and x != file
+                    info.update({"cancel": True, "message": message})
+                    for x, info in self.status.items()
+                    if not info["cancel"] and not info["started"] and x != file
                 ]
 
         return ok_to_proceed
@@ -84,18 +86,22 @@ def verify_proceed(func):
 def update_status(func):
     """Decorator for updating the status of files."""
 
+    # TODO (ina): add processing?
+    # Checked once when decorating instead of on every call
+    operation = func.__name__
+    if operation not in ["put", "add_file_db", "get", "update_db"]:
+        raise Exception(f"The function {operation} cannot be used with this decorator.")
+
     @functools.wraps(func)
     def wrapped(self, file, *args, **kwargs):
 
-        # TODO (ina): add processing?
-        if func.__name__ not in ["put", "add_file_db", "get", "update_db"]:
-            raise Exception(f"The function {func.__name__} cannot be used with this decorator.")
-        if func.__name__ not in self.status[file]:
-            raise Exception(f"No status found for function {func.__name__}.")
+        file_status = self.status[file]
+        if operation not in file_status:
+            raise Exception(f"No status found for function {operation}.")
 
         # Update status to started
-        self.status[file][func.__name__].update({"started": True})
-        LOG.debug(f"File {file} status updated to {func.__name__}: started")
+        file_status[operation]["started"] = True
+        LOG.debug("File %s status updated to %s: started", file, operation)
 
         # Run function
         ok_to_continue, message, *_ = func(self, file=file, *args, **kwargs)
@@ -103,13 +109,13 @@ def update_status(func):
         # ok_to_continue = False
         if not ok_to_continue:
             # Save info about which operation failed
-            self.status[file]["failed_op"] = func.__name__
-            LOG.warning(f"{func.__name__} failed: {message}")
+            file_status["failed_op"] = operation
+            LOG.warning("%s failed: %s", operation, message)
 
         else:
             # Update status to done
-            self.status[file][func.__name__].update({"done": True})
-            LOG.debug(f"File {file} status updated to {func.__name__}: done")
+            file_status[operation]["done"] = True
+            LOG.debug("File %s status updated to %s: done", file, operation)
 
         return ok_to_continue, message
 
@@ -131,6 +137,11 @@ def connect_cloud(func):
                 endpoint_url=self.url,
                 aws_access_key_id=self.keys["access_key"],
                 aws_secret_access_key=self.keys["secret_key"],
+                # The connection is shared by all upload/download threads
+                config=botocore.client.Config(
+                    max_pool_connections=64,
+                    retries={"max_attempts": 10, "mode": "adaptive"},
+                ),
             )
         except (boto3.exceptions.Boto3Error, botocore.exceptions.BotoCoreError) as err:
             self.url, self.keys, self.message = (
@@ -164,7 +175,7 @@ def subpath_required(func):
             except OSError as err:
                 return False, str(err)
 
-            LOG.info(f"New directory created: {full_subpath}")
+            LOG.info("New directory created: %s", full_subpath)
 
         return func(self, file=file, *args, **kwargs)
 
@@ -220,10 +231,6 @@ def removal_spinner(func):
             # therefore be printed directly
             table_len = 0
 
-        if table_len + 5 > dds_cli.utils.console.height:
-            with dds_cli.utils.console.pager():
-                dds_cli.utils.console.print(message)
-        else:
-            dds_cli.utils.console.print(message)
+        dds_cli.utils.print_or_page(message, estimated_lines=table_len + 5)
 
     return create_and_remove_task
@@ -6,15 +6,14 @@
 
 # Standard library
 import logging
-import os
 import pathlib
 
 # Installed
 import boto3
 import botocore
+import orjson
 import rich
 import requests
-import simplejson
 from rich.progress import Progress, SpinnerColumn
 
 # Own modules
@@ -24,7 +23,6 @@ from dds_cli import file_handler_remote as fhr
 from dds_cli import data_remover as dr
 from dds_cli import file_compressor as fc
 from dds_cli import file_encryptor as fe
-from dds_cli import s3_connector as s3
 from dds_cli import status
 from dds_cli import text_handler as txt
 from dds_cli.cli_decorators import verify_proceed, update_status, subpath_required
@@ -80,7 +78,7 @@ class DataGetter(base.DDSBaseClass):
             dds_cli.utils.console.print(
                 f"\n:no_entry_sign: Unauthorized method: {self.method} :no_entry_sign:\n"
             )
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         # Start file prep progress
         with Progress(
@@ -102,11 +100,11 @@ class DataGetter(base.DDSBaseClass):
                     "and '--break-on-fail' flag used. :warning:\n\n"
                     f"Files not found: {self.filehandler.failed}\n"
                 )
-                os._exit(1)
+                dds_cli.utils.exit_now(1)
 
             if not self.filehandler.data:
                 dds_cli.utils.console.print("\nNo files to download.\n")
-                os._exit(0)
+                dds_cli.utils.exit_now(0)
 
             self.status = self.filehandler.create_download_status_dict()
 
@@ -138,13 +136,13 @@ class DataGetter(base.DDSBaseClass):
             total=file_info["size_original"],
         )
 
-        LOG.debug(f"File {file} downloaded: {file_downloaded}")
+        LOG.debug("File %s downloaded: %s", file, file_downloaded)
 
         if file_downloaded:
             db_updated, message = self.update_db(file=file)
-            LOG.debug(f"Database updated: {db_updated}")
+            LOG.debug("Database updated: %s", db_updated)
 
-            LOG.info(f"Beginning decryption of file {file}...")
+            LOG.info("Beginning decryption of file %s...", file)
             file_saved = False
             with fe.Decryptor(
                 project_keys=self.keys,
@@ -165,7 +163,7 @@ class DataGetter(base.DDSBaseClass):
                     outfile=file,
                 )
 
-            LOG.debug(f"file saved? {file_saved}")
+            LOG.debug("file saved? %s", file_saved)
             if file_saved:
                 # TODO (ina): decide on checksum verification method --
                 # this checks original, the other is generated from compressed
@@ -186,32 +184,36 @@ class DataGetter(base.DDSBaseClass):
 
         downloaded = False
         error = ""
-        file_local = str(self.filehandler.data[file]["path_downloaded"])
-        file_remote = self.filehandler.data[file]["name_in_bucket"]
-
-        with s3.S3Connector(project_id=self.project, token=self.token) as conn:
-
-            if None in [conn.url, conn.keys, conn.bucketname]:
-                error = "No s3 info returned! " + conn.message
+        file_info = self.filehandler.data[file]
+        file_local = str(file_info["path_downloaded"])
+        file_remote = file_info["name_in_bucket"]
+
+        # Use the S3 connection shared by all files
+        conn = self.s3connector
+
+        if None in [conn.url, conn.keys, conn.bucketname]:
+            error = "No s3 info returned! " + conn.message
+        else:
+            # Upload file
+            try:
+                conn.resource.meta.client.download_file(
+                    Filename=file_local,
+                    Bucket=conn.bucketname,
+                    Key=file_remote,
+                    Callback=status.ProgressPercentage(progress=progress, task=task)
+                    if not self.silent
+                    else None,
+                    # Same part size as uploads - 16 MiB instead of the default 8 MiB
+                    Config=conn.transfer_config,
+                )
+            except (
+                botocore.client.ClientError,
+                boto3.exceptions.Boto3Error,
+            ) as err:
+                error = f"S3 download of file '{file}' failed: {err}"
+                LOG.exception("%s: %s", file, err)
             else:
-                # Upload file
-                try:
-                    conn.resource.meta.client.download_file(
-                        Filename=file_local,
-                        Bucket=conn.bucketname,
-                        Key=file_remote,
-                        Callback=status.ProgressPercentage(progress=progress, task=task)
-                        if not self.silent
-                        else None,
-                    )
-                except (
-                    botocore.client.ClientError,
-                    boto3.exceptions.Boto3Error,
-                ) as err:
-                    error = f"S3 download of file '{file}' failed: {err}"
-                    LOG.exception(f"{file}: {err}")
-                else:
-                    downloaded = True
+                downloaded = True
 
         return downloaded, error
 
@@ -228,7 +230,7 @@ class DataGetter(base.DDSBaseClass):
 
         # Send file info to API
         try:
-            response = requests.put(DDSEndpoint.FILE_UPDATE, params=params, headers=self.token)
+            response = self.session.put(DDSEndpoint.FILE_UPDATE, params=params)
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
 
@@ -239,8 +241,8 @@ class DataGetter(base.DDSBaseClass):
             return updated_in_db, error
 
         try:
-            updated_in_db, error = (True, response.json()["message"])
-        except simplejson.JSONDecodeError as err:
+            updated_in_db, error = (True, orjson.loads(response.content)["message"])
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         return updated_in_db, error
@@ -5,17 +5,19 @@
 ###############################################################################
 
 # Standard library
-from dataclasses import dataclass
+import concurrent.futures
 import logging
+import operator
 import os
 import pathlib
 from typing import Tuple, Union, List
 
 # Installed
+import orjson
 import requests
-import simplejson
 from rich.padding import Padding
-from rich.table import Table
+from rich.table import Column, Table
+from rich.text import Text
 from rich.tree import Tree
 
 # Own modules
@@ -86,71 +88,61 @@ class DataLister(base.DDSBaseClass):
             LOG.warning(f"Can only sort by {sort_by} when using the --usage flag.")
             sort_by = "updated"
 
-        # Sort according to ID
-        sorted_projects = sorted(projects, key=lambda i: i["Project ID"])
-
-        # Sort again according to chosen of default option
+        # Only sort according to ID if no other valid option
         sort_by = sorting_dict.get(sort_by)
-        if sort_by:
-            sorted_projects = sorted(
-                sorted_projects,
-                key=lambda t: (t[sort_by] is None, t[sort_by]),
-                reverse=sort_by == sorting_dict.get("updated"),
-            )
-
-        return sorted_projects
+        if sort_by in [None, sorting_dict["id"]]:
+            return sorted(projects, key=lambda i: i["Project ID"])
+
+        # Sort according to chosen option, ties sorted according to ID
+        if sort_by != sorting_dict["updated"]:
+            return sorted(projects, key=lambda t: (t[sort_by] is None, t[sort_by], t["Project ID"]))
+
+        # Last updated first - sort according to ID first so that ties are not reversed
+        return sorted(
+            sorted(projects, key=lambda i: i["Project ID"]),
+            key=lambda t: (t[sort_by] is None, t[sort_by]),
+            reverse=True,
+        )
 
     def format_columns(self, total_size=None, usage_info=None):
-        """Define the formatting for the project table according to what is returned from API."""
+        """Define the columns of the project table according to what is returned from API.
+
+        Returns the column names, which are also the project keys, and the table columns.
+        """
 
         default_format = {"justify": "left", "style": "", "footer": "", "overflow": "fold"}
+        size_format = {**default_format, "justify": "center", "overflow": "ellipsis"}
 
         # Choose formattting
         column_formatting = {
             "Project ID": {
-                "justify": default_format.get("justify"),
+                **default_format,
                 "style": "green",
-                "footer": "Total" if self.show_usage else default_format.get("footer"),
-                "overflow": default_format.get("overflow"),
+                "footer": "Total" if self.show_usage else default_format["footer"],
             },
             **{x: default_format for x in ["Title", "PI", "Status", "Last updated"]},
-            "Size": {
-                "justify": "center",
-                "style": default_format.get("style"),
-                "footer": total_size,
-                "overflow": "ellipsis",
-            },
+            "Size": {**size_format, "footer": total_size},
         }
 
         if usage_info and self.show_usage:
             # Only display costs above 1 kr
             column_formatting.update(
                 {
-                    "GBHours": {
-                        "justify": "center",
-                        "style": default_format.get("style"),
-                        "footer": str(usage_info["gbhours"]),
-                        "overflow": "ellipsis",
-                    },
-                    "Cost": {
-                        "justify": "center",
-                        "style": default_format.get("style"),
-                        "footer": str(usage_info["cost"]),
-                        "overflow": "ellipsis",
-                    },
+                    "GBHours": {**size_format, "footer": str(usage_info["gbhours"])},
+                    "Cost": {**size_format, "footer": str(usage_info["cost"])},
                 }
             )
 
-        return column_formatting
+        return tuple(column_formatting), [
+            Column(colname, **colformat) for colname, colformat in column_formatting.items()
+        ]
 
     def list_projects(self, sort_by="Updated"):
         """Gets a list of all projects the user is involved in."""
 
         # Get projects from API
         try:
-            response = requests.get(
-                DDSEndpoint.LIST_PROJ, headers=self.token, params={"usage": self.show_usage}
-            )
+            response = self.session.get(DDSEndpoint.LIST_PROJ, params={"usage": self.show_usage})
         except requests.exceptions.RequestException as err:
             raise exceptions.ApiRequestError(message=str(err))
 
@@ -160,8 +152,8 @@ class DataLister(base.DDSBaseClass):
 
         # Get result from API
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise exceptions.APIError(f"Could not decode JSON response: {err}")
 
         # Cancel if user not involved in any projects
@@ -175,10 +167,11 @@ class DataLister(base.DDSBaseClass):
         sorted_projects = self.sort_projects(projects=project_info, sort_by=sort_by)
 
         # Column format
-        column_formatting = self.format_columns(total_size=total_size, usage_info=usage_info)
+        column_names, columns = self.format_columns(total_size=total_size, usage_info=usage_info)
 
         # Create table
         table = Table(
+            *columns,
             title="Your Projects",
             show_header=True,
             header_style="bold",
@@ -191,28 +184,15 @@ class DataLister(base.DDSBaseClass):
             else None,
         )
 
-        # Add columns to table
-        for colname, colformat in column_formatting.items():
-            table.add_column(
-                colname,
-                justify=colformat["justify"],
-                style=colformat["style"],
-                footer=colformat["footer"],
-                overflow=colformat["overflow"],
-            )
-
         # Add all column values for each row to table
+        get_row = operator.itemgetter(*column_names)
         for proj in sorted_projects:
-            table.add_row(*[proj[i] for i in column_formatting])
+            table.add_row(*get_row(proj))
 
         # Print to stdout if there are any lines
         if table.columns:
             # Use a pager if output is taller than the visible terminal
-            if len(sorted_projects) + 5 > dds_cli.utils.console.height:
-                with dds_cli.utils.console.pager():
-                    dds_cli.utils.console.print(table)
-            else:
-                dds_cli.utils.console.print(table)
+            dds_cli.utils.print_or_page(table, estimated_lines=len(sorted_projects) + 5)
         else:
             raise exceptions.NoDataError(f"No projects found")
 
@@ -228,10 +208,9 @@ class DataLister(base.DDSBaseClass):
 
         # Make call to API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.LIST_FILES,
                 params={"subpath": folder, "show_size": show_size},
-                headers=self.token,
             )
         except requests.exceptions.RequestException as err:
             raise exceptions.APIError(f"Problem with database response: '{err}'")
@@ -241,9 +220,9 @@ class DataLister(base.DDSBaseClass):
 
         # Get response
         try:
-            resp_json = response.json()
-            print(resp_json)
-        except simplejson.JSONDecodeError as err:
+            resp_json = orjson.loads(response.content)
+            LOG.debug("Listed %s files and folders", len(resp_json.get("files_folders", [])))
+        except orjson.JSONDecodeError as err:
             raise exceptions.APIError(f"Could not decode JSON response: '{err}'")
 
         # Check if project empty
@@ -263,18 +242,14 @@ class DataLister(base.DDSBaseClass):
         if not sorted_files_folders:
             raise exceptions.NoDataError(f"Could not find folder: '{folder}'")
 
-        # Get max length of file name
-        max_string = max([len(x["name"]) for x in sorted_files_folders])
-
-        # Get max length of size string
-        max_size = max(
-            [
-                len(x["size"].split(" ")[0])
-                for x in sorted_files_folders
-                if show_size and "size" in x
-            ],
-            default=0,
-        )
+        # Get max length of file name and size string in one pass,
+        # split the sizes into number and unit once
+        max_string, max_size = (0, 0)
+        for x in sorted_files_folders:
+            max_string = max(max_string, len(x["name"]))
+            if show_size and "size" in x:
+                x["size_parts"] = x["size"].split()
+                max_size = max(max_size, len(x["size_parts"][0]))
 
         # Visible folders
         visible_folders = []
@@ -290,128 +265,157 @@ class DataLister(base.DDSBaseClass):
                 max_string_len=max_string,
             )
 
-            # Add formatting if folder and set string name
-            line = ""
+            # Add formatting if folder and set string name - styled Text is not parsed for markup
+            line = Text(
+                x["name"] + ("/" if is_folder else ""),
+                style="bold deep_sky_blue3" if is_folder else "",
+            )
             if is_folder:
-                line = "[bold deep_sky_blue3]"
                 visible_folders.append(x["name"])
-            line += x["name"] + ("/" if is_folder else "")
 
             # Add size to line if option specified
-            if show_size and "size" in x:
-                line += f"{tab}{x['size'].split()[0]}"
+            if "size_parts" in x:
+                size_number, size_unit = x["size_parts"]
 
                 # Define space between number and size format
                 tabs_bf_format = th.TextHandler.format_tabs(
                     string_len=len(x["size"]), max_string_len=max_size, tab_len=2
                 )
-                line += f"{tabs_bf_format}{x['size'].split()[1]}"
+                line.append(f"{tab}{size_number}{tabs_bf_format}{size_unit}")
             tree.add(line)
 
         # Print output to stdout
-        if len(files_folders) + 5 > dds_cli.utils.console.height:
-            with dds_cli.utils.console.pager():
-                dds_cli.utils.console.print(Padding(tree, 1))
-        else:
-            dds_cli.utils.console.print(Padding(tree, 1))
+        dds_cli.utils.print_or_page(Padding(tree, 1), estimated_lines=len(files_folders) + 5)
 
         # Return variable
         return visible_folders
 
     def list_recursive(self, show_size: bool = False):
-        @dataclass
         class FileTree:
             """
             Container class for holding information about the remote file tree
             """
 
-            subtrees: List[Union["FileTree", Tuple[str, str]]] = None
-            name: str = None
+            # No per-node __dict__ - large projects create many nodes
+            __slots__ = ("subtrees", "name")
 
-        def _construct_file_tree(folder: str, basename: str) -> Tuple[FileTree, int, int]:
+            def __init__(
+                self,
+                subtrees: List[Union["FileTree", Tuple[str, List[str]]]] = None,
+                name: str = None,
+            ):
+                self.subtrees = subtrees
+                self.name = name
+
+        def _get_folder_contents(folder: str) -> List[dict]:
             """
-            Recurses through the project directories and constructs a file tree
-            by subsequent calls to the API
+            Get the files and folders in a project directory, sorted by name
             """
             # Make call to API
             try:
-                resp_json = requests.get(
+                response = self.session.get(
                     DDSEndpoint.LIST_FILES,
                     params={"subpath": folder, "show_size": show_size},
-                    headers=self.token,
                 )
             except requests.exceptions.RequestException as err:
                 raise exceptions.APIError(f"Problem with database response: '{err}'")
 
-            resp_json = resp_json.json()
-            tree = FileTree([], f"{basename}/")
+            try:
+                resp_json = orjson.loads(response.content)
+            except orjson.JSONDecodeError as err:
+                raise exceptions.APIError(f"Could not decode JSON response: '{err}'")
+
             sorted_files_folders = sorted(resp_json["files_folders"], key=lambda f: f["name"])
 
             if not sorted_files_folders:
                 raise exceptions.NoDataError(f"Could not find folder: '{folder}'")
 
-            # Get max length of file name
-            max_string = max([len(x["name"]) for x in sorted_files_folders])
-
-            # Get max length of size string
-            max_size = max(
-                [
-                    len(x["size"].split(" ")[0])
-                    for x in sorted_files_folders
-                    if show_size and "size" in x
-                ],
-                default=0,
-            )
-            # Rich outputs precisely one line per file/folder
-            for f in sorted_files_folders:
-                is_folder = f.pop("folder")
-
-                if not is_folder:
-                    tree.subtrees.append((f["name"], f.get("size") if show_size else None))
-                else:
-                    subtree, _max_string, _max_size = _construct_file_tree(
-                        os.path.join(folder, f["name"]) if folder else f["name"],
-                        f"[bold deep_sky_blue3]{f['name']}",
-                    )
-                    # Due to indentation, the filename strings of
-                    # subdirectories are 4 characters deeper than
-                    # their parent directories
-                    max_string = max(max_string, _max_string + 4)
-                    max_size = max(max_size, _max_size)
-                    tree.subtrees.append(subtree)
-
-            return tree, max_string, max_size
+            return sorted_files_folders
+
+        def _construct_file_tree(basename: str) -> Tuple[FileTree, int, int]:
+            """
+            Walks through the project directories one level at a time and constructs
+            a file tree, the folders on the same level are requested from the API in parallel
+            """
+            file_tree = FileTree([], f"{basename}/")
+            max_string, max_size = (0, 0)
+
+            # Folders to list on the current level: (path, tree to add contents to, depth)
+            level = [(None, file_tree, 0)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=16) as texec:
+                while level:
+                    all_contents = texec.map(lambda x: _get_folder_contents(x[0]), level)
+
+                    next_level = []
+                    for (folder, tree, depth), sorted_files_folders in zip(level, all_contents):
+                        # Rich outputs precisely one line per file/folder
+                        for f in sorted_files_folders:
+                            is_folder = f.pop("folder")
+
+                            # Get max length of file name - due to indentation, the filename
+                            # strings of subdirectories are 4 characters deeper than their
+                            # parent directories
+                            max_string = max(max_string, len(f["name"]) + 4 * depth)
+
+                            # Split the size into number and unit once
+                            size_parts = f["size"].split() if show_size and "size" in f else None
+                            if size_parts:
+                                # Get max length of size string
+                                max_size = max(max_size, len(size_parts[0]))
+
+                            if not is_folder:
+                                tree.subtrees.append((f["name"], size_parts))
+                            else:
+                                subtree = FileTree([], f"[bold deep_sky_blue3]{f['name']}/")
+                                tree.subtrees.append(subtree)
+                                next_level.append(
+                                    (
+                                        os.path.join(folder, f["name"]) if folder else f["name"],
+                                        subtree,
+                                        depth + 1,
+                                    )
+                                )
+
+                    level = next_level
+
+            return file_tree, max_string, max_size
 
         def _construct_rich_tree(
-            file_tree: FileTree, max_str: int, max_size: int, depth: int
+            file_tree: FileTree, max_str: int, max_size: int
         ) -> Tuple[Tree, int]:
             """
             Construct the rich tree from the file tree
             """
             tree = Tree(file_tree.name)
-            tree_length = len(file_tree.subtrees)
-            for node in file_tree.subtrees:
-                if isinstance(node, FileTree):
-                    subtree, length = _construct_rich_tree(node, max_str, max_size, depth + 1)
-                    tree.add(subtree)
-                    tree_length += length
-                else:
-                    line = node[0]
-                    if show_size and node[1] is not None:
-                        tab = th.TextHandler.format_tabs(
-                            string_len=len(node[0]),
-                            max_string_len=max_str - 4 * depth,
-                        )
-                        line += f"{tab}{node[1].split()[0]}"
-
-                        # Define space between number and size format
-                        tabs_bf_format = th.TextHandler.format_tabs(
-                            string_len=len(node[1].split()[1]),
-                            max_string_len=max_size,
-                            tab_len=2,
-                        )
-                        line += f"{tabs_bf_format}{node[1].split()[1]}"
-                    tree.add(line)
+            tree_length = 0
+
+            # Folders left to add contents for: (rich tree, file tree, depth)
+            stack = [(tree, file_tree, 0)]
+            while stack:
+                rich_tree, current_tree, depth = stack.pop()
+                tree_length += len(current_tree.subtrees)
+                for node in current_tree.subtrees:
+                    if isinstance(node, FileTree):
+                        # Add the folder now to keep the order, its contents later
+                        stack.append((rich_tree.add(node.name), node, depth + 1))
+                    else:
+                        line = node[0]
+                        if show_size and node[1] is not None:
+                            size_number, size_unit = node[1]
+                            tab = th.TextHandler.format_tabs(
+                                string_len=len(node[0]),
+                                max_string_len=max_str - 4 * depth,
+                            )
+                            line += f"{tab}{size_number}"
+
+                            # Define space between number and size format
+                            tabs_bf_format = th.TextHandler.format_tabs(
+                                string_len=len(size_unit),
+                                max_string_len=max_size,
+                                tab_len=2,
+                            )
+                            line += f"{tabs_bf_format}{size_unit}"
+                        rich_tree.add(line)
 
             return tree, tree_length
 
@@ -419,28 +423,13 @@ class DataLister(base.DDSBaseClass):
         # constructing, since it is difficult to compute the correct size
         # indentation without the whole tree
         file_tree, max_string, max_size = _construct_file_tree(
-            None, f"[bold magenta]Files & directories in project: [green]{self.project}"
+            f"[bold magenta]Files & directories in project: [green]{self.project}"
         )
 
-        tree, tree_length = _construct_rich_tree(file_tree, max_string, max_size, 0)
+        tree, tree_length = _construct_rich_tree(file_tree, max_string, max_size)
 
-        # The first header is not accounted for by the recursion
+        # The first header is not accounted for when walking the tree
         tree_length += 1
 
-        # Check if the tree is t0o large to be printed directly
-        # and use a pager if that is the case
-        if tree_length > dds_cli.utils.console.height:
-            with dds_cli.utils.console.pager():
-                dds_cli.utils.console.print(
-                    Padding(
-                        tree,
-                        1,
-                    )
-                )
-        else:
-            dds_cli.utils.console.print(
-                Padding(
-                    tree,
-                    1,
-                )
-            )
+        # Use a pager if the tree is too large to be printed directly
+        dds_cli.utils.print_or_page(Padding(tree, 1), estimated_lines=tree_length)
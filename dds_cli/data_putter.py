@@ -13,9 +13,9 @@ import pathlib
 # Installed
 import boto3
 import botocore
+import orjson
 import requests
 from rich.progress import Progress, SpinnerColumn, BarColumn
-import simplejson
 
 # Own modules
 from dds_cli import base
@@ -24,7 +24,6 @@ from dds_cli import data_remover as dr
 from dds_cli import DDSEndpoint
 from dds_cli import file_encryptor as fe
 from dds_cli import file_handler_local as fhl
-from dds_cli import s3_connector as s3
 from dds_cli import status
 from dds_cli import text_handler as txt
 from dds_cli.cli_decorators import verify_proceed, update_status, subpath_required
@@ -92,7 +91,7 @@ def put(
 
                 # Schedule the first num_threads futures for upload
                 for file in itertools.islice(iterator, num_threads):
-                    LOG.info(f"Starting: {file}")
+                    LOG.info("Starting: %s", file)
                     upload_threads[
                         texec.submit(
                             putter.protect_and_upload,
@@ -116,14 +115,16 @@ def put(
                         # Get result from future and schedule database update
                         for fut in done:
                             uploaded_file = upload_threads.pop(fut)
-                            LOG.debug(f"Future done for file: {uploaded_file}")
+                            LOG.debug("Future done for file: %s", uploaded_file)
 
                             # Get result
                             try:
                                 file_uploaded = fut.result()
-                                LOG.debug(f"Upload of {uploaded_file} successful: {file_uploaded}")
+                                LOG.debug(
+                                    "Upload of %s successful: %s", uploaded_file, file_uploaded
+                                )
                             except concurrent.futures.BrokenExecutor as err:
-                                LOG.error(f"Upload of file {uploaded_file} failed! Error: {err}")
+                                LOG.error("Upload of file %s failed! Error: %s", uploaded_file, err)
                                 continue
 
                             # Increase the main progress bar
@@ -134,7 +135,7 @@ def put(
 
                         # Schedule the next set of futures for upload
                         for next_file in itertools.islice(iterator, new_tasks):
-                            LOG.info(f"Starting: {next_file}")
+                            LOG.info("Starting: %s", next_file)
                             upload_threads[
                                 texec.submit(
                                     putter.protect_and_upload,
@@ -188,55 +189,64 @@ class DataPutter(base.DDSBaseClass):
         # Initiate DDSBaseClass to authenticate user
         super().__init__(username=username, config=config, project=project, method=method)
 
-        # Initiate DataPutter specific attributes
-        self.break_on_fail = break_on_fail
-        self.overwrite = overwrite
-        self.silent = silent
-        self.filehandler = None
-
-        # Only method "put" can use the DataPutter class
-        if self.method != "put":
-            raise exceptions.AuthenticationError(f"Unauthorized method: '{self.method}'")
-
-        # Start file prep progress
-        with Progress(
-            "[bold]{task.description}",
-            SpinnerColumn(spinner_name="dots12", style="white"),
-            console=dds_cli.utils.console,
-        ) as progress:
-            # Spinner while collecting file info
-            wait_task = progress.add_task("Collecting and preparing data", step="prepare")
-
-            # Get file info
-            self.filehandler = fhl.LocalFileHandler(
-                user_input=(source, source_path_file),
-                temporary_destination=self.dds_directory.directories["FILES"],
-            )
-
-            # Verify that the Safespring S3 bucket exists
-            self.verify_bucket_exist()
+        # __exit__ is not called if __init__ fails - close the API and S3 connections here
+        try:
+            # Initiate DataPutter specific attributes
+            self.break_on_fail = break_on_fail
+            self.overwrite = overwrite
+            self.silent = silent
+            self.filehandler = None
+
+            # Only method "put" can use the DataPutter class
+            if self.method != "put":
+                raise exceptions.AuthenticationError(f"Unauthorized method: '{self.method}'")
+
+            # Start file prep progress
+            with Progress(
+                "[bold]{task.description}",
+                SpinnerColumn(spinner_name="dots12", style="white"),
+                console=dds_cli.utils.console,
+            ) as progress:
+                # Spinner while collecting file info
+                wait_task = progress.add_task("Collecting and preparing data", step="prepare")
+
+                # Get file info
+                self.filehandler = fhl.LocalFileHandler(
+                    user_input=(source, source_path_file),
+                    temporary_destination=self.dds_directory.directories["FILES"],
+                )
 
-            # Check which, if any, files exist in the db
-            files_in_db = self.filehandler.check_previous_upload(token=self.token)
+                # Verify that the Safespring S3 bucket exists and check which, if any,
+                # files exist in the db - independent requests so run them concurrently
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as texec:
+                    bucket_verified = texec.submit(self.verify_bucket_exist)
+                    previous_upload = texec.submit(
+                        self.filehandler.check_previous_upload, token=self.token
+                    )
+                    bucket_verified.result()
+                    files_in_db = previous_upload.result()
+
+                # Quit if error and flag
+                if files_in_db and self.break_on_fail and not self.overwrite:
+                    raise exceptions.UploadError(
+                        "Some files have already been uploaded (or have identical names to "
+                        "previously uploaded files) and the '--break-on-fail' flag was used. "
+                        "Try again with the '--overwrite' flag if you want to upload these files."
+                    )
 
-            # Quit if error and flag
-            if files_in_db and self.break_on_fail and not self.overwrite:
-                raise exceptions.UploadError(
-                    "Some files have already been uploaded (or have identical names to "
-                    "previously uploaded files) and the '--break-on-fail' flag was used. "
-                    "Try again with the '--overwrite' flag if you want to upload these files."
+                # Generate status dict
+                self.status = self.filehandler.create_upload_status_dict(
+                    existing_files=files_in_db, overwrite=self.overwrite
                 )
 
-            # Generate status dict
-            self.status = self.filehandler.create_upload_status_dict(
-                existing_files=files_in_db, overwrite=self.overwrite
-            )
+                # Remove spinner
+                progress.remove_task(wait_task)
 
-            # Remove spinner
-            progress.remove_task(wait_task)
-
-        if not self.filehandler.data:
-            raise exceptions.UploadError("No data to upload.")
+            if not self.filehandler.data:
+                raise exceptions.UploadError("No data to upload.")
+        except BaseException:
+            self.close()
+            raise
 
     # Public methods ###################### Public methods #
     @verify_proceed
@@ -273,29 +283,31 @@ class DataPutter(base.DDSBaseClass):
             file_public_key = encryptor.get_public_component_hex(private_key=encryptor.my_private)
             salt = encryptor.salt
 
-        LOG.debug(f"Updating file processed size: {file_info['path_processed']}")
+        LOG.debug("Updating file processed size: %s", file_info["path_processed"])
 
         # Update file info incl size, public key, salt
-        self.filehandler.data[file]["public_key"] = file_public_key
-        self.filehandler.data[file]["key_salt"] = salt
-        self.filehandler.data[file]["size_processed"] = file_info["path_processed"].stat().st_size
+        file_info["public_key"] = file_public_key
+        file_info["key_salt"] = salt
+        file_info["size_processed"] = file_info["path_processed"].stat().st_size
 
         if saved:
             LOG.info(
-                f"File successfully encrypted: {file}. New location: {file_info['path_processed']}"
+                "File successfully encrypted: %s. New location: %s",
+                file,
+                file_info["path_processed"],
             )
             # Update progress bar for upload
             progress.reset(
                 task,
                 description=txt.TextHandler.task_name(file=file, step="put"),
-                total=self.filehandler.data[file]["size_processed"],
+                total=file_info["size_processed"],
                 step="put",
             )
 
             # Perform upload
             file_uploaded, message = self.put(file=file, progress=progress, task=task)
 
-            LOG.debug(f"File uploaded: {file_uploaded}")
+            LOG.debug("File uploaded: %s", file_uploaded)
             # Perform db update
             if file_uploaded:
                 db_updated, message = self.add_file_db(file=file)
@@ -305,10 +317,12 @@ class DataPutter(base.DDSBaseClass):
 
         if not saved or all_ok:
             # Delete temporary processed file locally
-            LOG.debug(
-                f"Deleting file {file_info['path_processed']} - "
-                f"exists: {file_info['path_processed'].exists()}"
-            )
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug(
+                    "Deleting file %s - exists: %s",
+                    file_info["path_processed"],
+                    file_info["path_processed"].exists(),
+                )
             dr.DataRemover.delete_tempfile(file=file_info["path_processed"])
 
         # Remove progress bar task
@@ -325,47 +339,50 @@ class DataPutter(base.DDSBaseClass):
         error = ""
 
         # File info
-        file_local = str(self.filehandler.data[file]["path_processed"])
-        file_remote = self.filehandler.data[file]["path_remote"]
-
-        with s3.S3Connector(project_id=self.project, token=self.token) as conn:
-
-            # Check that connection ok and upload file
-            if None in [
-                conn.safespring_project,
-                conn.url,
-                conn.keys,
-                conn.bucketname,
-            ]:
-                error = "No s3 info returned! " + conn.message
-            else:
-                # Upload file
-                try:
-                    conn.resource.meta.client.upload_file(
-                        Filename=file_local,
-                        Bucket=conn.bucketname,
-                        Key=file_remote,
-                        ExtraArgs={
-                            "ACL": "private",  # Access control list
-                            "CacheControl": "no-store",  # Don't store cache
-                        },
-                        Callback=status.ProgressPercentage(
-                            progress=progress,
-                            task=task,
-                        )
-                        if task is not None
-                        else None,
+        file_info = self.filehandler.data[file]
+        file_local = str(file_info["path_processed"])
+        file_remote = file_info["path_remote"]
+
+        # Use the S3 connection shared by all files
+        conn = self.s3connector
+
+        # Check that connection ok and upload file
+        if None in [
+            conn.safespring_project,
+            conn.url,
+            conn.keys,
+            conn.bucketname,
+        ]:
+            error = "No s3 info returned! " + conn.message
+        else:
+            # Upload file
+            try:
+                conn.resource.meta.client.upload_file(
+                    Filename=file_local,
+                    Bucket=conn.bucketname,
+                    Key=file_remote,
+                    ExtraArgs={
+                        "ACL": "private",  # Access control list
+                        "CacheControl": "no-store",  # Don't store cache
+                    },
+                    Callback=status.ProgressPercentage(
+                        progress=progress,
+                        task=task,
                     )
-                except (
-                    botocore.client.ClientError,
-                    boto3.exceptions.Boto3Error,
-                    FileNotFoundError,
-                    TypeError,
-                ) as err:
-                    error = f"S3 upload of file '{file}' failed: {err}"
-                    LOG.exceptionf("{file}: {err}")
-                else:
-                    uploaded = True
+                    if task is not None
+                    else None,
+                    Config=conn.transfer_config,
+                )
+            except (
+                botocore.client.ClientError,
+                boto3.exceptions.Boto3Error,
+                FileNotFoundError,
+                TypeError,
+            ) as err:
+                error = f"S3 upload of file '{file}' failed: {err}"
+                LOG.exception("%s: %s", file, err)
+            else:
+                uploaded = True
 
         return uploaded, error
 
@@ -392,12 +409,11 @@ class DataPutter(base.DDSBaseClass):
         }
 
         # Send file info to API - post if new file, put if overwrite
-        put_or_post = requests.put if fileinfo["overwrite"] else requests.post
+        put_or_post = self.session.put if fileinfo["overwrite"] else self.session.post
         try:
             response = put_or_post(
                 DDSEndpoint.FILE_NEW,
                 params=params,
-                headers=self.token,
                 timeout=DDSEndpoint.TIMEOUT,
             )
         except requests.exceptions.RequestException as err:
@@ -411,8 +427,8 @@ class DataPutter(base.DDSBaseClass):
                 return added_to_db, error
 
             try:
-                added_to_db, error = (True, response.json().get("message"))
-            except simplejson.JSONDecodeError as err:
+                added_to_db, error = (True, orjson.loads(response.content).get("message"))
+            except orjson.JSONDecodeError as err:
                 error = str(err)
                 LOG.warning(error)
 
@@ -425,9 +441,7 @@ class DataPutter(base.DDSBaseClass):
 
         # Perform request to DDS API
         try:
-            response = requests.put(
-                DDSEndpoint.PROJECT_SIZE, headers=self.token, timeout=DDSEndpoint.TIMEOUT
-            )
+            response = self.session.put(DDSEndpoint.PROJECT_SIZE, timeout=DDSEndpoint.TIMEOUT)
         except requests.exceptions.RequestException as err:
             # Log warning if error
             # TODO (ina): Add the info to the error log if this happens --> can update manually
@@ -441,8 +455,8 @@ class DataPutter(base.DDSBaseClass):
         else:
             # Get response from endpoint
             try:
-                json_resp = response.json()
-            except simplejson.JSONDecodeError as err:
+                json_resp = orjson.loads(response.content)
+            except orjson.JSONDecodeError as err:
                 LOG.warning(str(err))
             else:
                 updated = json_resp.get("updated")
@@ -10,11 +10,12 @@ import pathlib
 import sys
 
 # Installed
+import orjson
 import requests
 import rich
 import rich.table
 import rich.padding
-import simplejson
+import rich.text
 
 # Own modules
 from dds_cli.cli_decorators import removal_spinner
@@ -74,14 +75,15 @@ class DataRemover(base.DDSBaseClass):
             for x in columns:
                 table.add_column(x)
 
-            # Add rows
+            # Add rows - styled Text instead of markup which would be parsed for every cell
+            not_exists_error = rich.text.Text(f"No such {level.lower()}")
             for x in not_exists:
-                table.add_row(x, f"No such {level.lower()}")
+                table.add_row(rich.text.Text(x), not_exists_error)
 
             for x, y in delete_failed.items():
                 table.add_row(
-                    f"[light_salmon3]{x}[/light_salmon3]",
-                    f"[light_salmon3]{y}[/light_salmon3]",
+                    rich.text.Text(x, style="light_salmon3"),
+                    rich.text.Text(str(y), style="light_salmon3"),
                 )
 
             # Print out table
@@ -106,7 +108,7 @@ class DataRemover(base.DDSBaseClass):
 
         # Perform request to API to perform deletion
         try:
-            response = requests.delete(DDSEndpoint.REMOVE_PROJ_CONT, headers=self.token)
+            response = self.session.delete(DDSEndpoint.REMOVE_PROJ_CONT)
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
 
@@ -115,8 +117,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Print out response - deleted or not?
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         if resp_json["removed"]:
@@ -133,7 +135,7 @@ class DataRemover(base.DDSBaseClass):
         """Remove specific files."""
 
         try:
-            response = requests.delete(DDSEndpoint.REMOVE_FILE, json=files, headers=self.token)
+            response = self.session.delete(DDSEndpoint.REMOVE_FILE, json=files)
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
 
@@ -142,8 +144,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Get info in response
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         return self.__response_delete(resp_json=resp_json)
@@ -153,7 +155,7 @@ class DataRemover(base.DDSBaseClass):
         """Remove specific folders."""
 
         try:
-            response = requests.delete(DDSEndpoint.REMOVE_FOLDER, json=folder, headers=self.token)
+            response = self.session.delete(DDSEndpoint.REMOVE_FOLDER, json=folder)
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
 
@@ -165,8 +167,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Make sure required info is returned
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         return self.__response_delete(resp_json=resp_json, level="Folder")
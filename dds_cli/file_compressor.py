@@ -9,7 +9,6 @@ import dataclasses
 import logging
 import os
 import pathlib
-import traceback
 
 
 # Installed
@@ -41,44 +40,52 @@ class CompressionMagic:
     ZSTANDARD = b"(\xb5/\xfd"
 
 
+# Signatures of compressed file formats - built once and shared by all Compressors
+MAGIC_DICT = immutabledict.immutabledict(
+    {
+        b"\x913HF": "hap",
+        b"`\xea": "arj",
+        b"_'\xa8\x89": "jar",
+        b"ZOO ": "zoo",
+        b"PK\x03\x04": "zip",
+        b"\x1F\x8B": "gzip",
+        b"UFA\xc6\xd2\xc1": "ufa",
+        b"StuffIt ": "sit",
+        b"Rar!\x1a\x07\x00": "rar v4.x",
+        b"Rar!\x1a\x07\x01\x00": "rar v5",
+        b"MAr0\x00": "mar",
+        b"DMS!": "dms",
+        b"CRUSH v": "cru",
+        b"BZh": "bz2",
+        b"-lh": "lha",
+        b"(This fi": "hqx",
+        b"!\x12": "ain",
+        b"\x1a\x0b": "pak",
+        b"(\xb5/\xfd": "zst",
+    }
+)
+
+# All signatures in a tuple, to check a file start with a single startswith call
+MAGIC_PREFIXES = tuple(MAGIC_DICT)
+
+# Number of bytes to read from a file to be able to check all signatures
+MAX_MAGIC_LEN = max(len(x) for x in MAGIC_DICT)
+
+
 @dataclasses.dataclass
 class Compressor:
     """Handles operations relating to file compression."""
 
     algorithm: str = "zstandard"
-    fmt_magic: dict = dataclasses.field(init=False)
-    max_magic_len: int = dataclasses.field(init=False)
-
-    def __post_init__(self):
-        self.fmt_magic = {
-            b"\x913HF": "hap",
-            b"`\xea": "arj",
-            b"_'\xa8\x89": "jar",
-            b"ZOO ": "zoo",
-            b"PK\x03\x04": "zip",
-            b"\x1F\x8B": "gzip",
-            b"UFA\xc6\xd2\xc1": "ufa",
-            b"StuffIt ": "sit",
-            b"Rar!\x1a\x07\x00": "rar v4.x",
-            b"Rar!\x1a\x07\x01\x00": "rar v5",
-            b"MAr0\x00": "mar",
-            b"DMS!": "dms",
-            b"CRUSH v": "cru",
-            b"BZh": "bz2",
-            b"-lh": "lha",
-            b"(This fi": "hqx",
-            b"!\x12": "ain",
-            b"\x1a\x0b": "pak",
-            b"(\xb5/\xfd": "zst",
-        }
-        self.max_magic_len = max(len(x) for x in self.fmt_magic)
+    fmt_magic: immutabledict.immutabledict = dataclasses.field(default=MAGIC_DICT, init=False)
+    max_magic_len: int = dataclasses.field(default=MAX_MAGIC_LEN, init=False)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
         if exc_type is not None:
-            traceback.print_exception(exc_type, exc_value, tb)
+            LOG.error("Compression failed", exc_info=(exc_type, exc_value, tb))
             return False  # uncomment to pass exception through
 
         return True
@@ -148,16 +155,15 @@ class Compressor:
     def is_compressed(self, file):
         """Checks if a file is compressed or not."""
 
+        # The file is only read - the process wide umask is not touched since
+        # this is called from several threads at once
         compressed, error = (False, "")
         try:
-            original_umask = os.umask(0)  # User file-creation mode mask
             with file.open(mode="rb") as f:
                 file_start = f.read(self.max_magic_len)
-                if file_start.startswith(tuple(x for x in self.fmt_magic)):
+                if file_start.startswith(MAGIC_PREFIXES):
                     compressed = True
         except OSError as err:
             error = str(err)
-        finally:
-            os.umask(original_umask)
 
         return compressed, error
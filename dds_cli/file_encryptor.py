@@ -9,7 +9,6 @@ import hashlib
 import logging
 import os
 import pathlib
-import traceback
 
 # Installed
 from cryptography.hazmat import backends
@@ -62,7 +61,7 @@ class ECDHKeyHandler:
             backend=backends.default_backend(),
         ).derive(shared_key)
 
-        LOG.debug(f"Salt: {salt}")
+        LOG.debug("Salt: %s", salt)
         return derived_shared_key, salt.hex().upper()
 
     @staticmethod
@@ -109,7 +108,7 @@ class Encryptor(ECDHKeyHandler):
 
     def __exit__(self, exc_type, exc_value, tb):
         if exc_type is not None:
-            traceback.print_exception(exc_type, exc_value, tb)
+            LOG.error("Encryption failed", exc_info=(exc_type, exc_value, tb))
             return False  # uncomment to pass exception through
 
         return True
@@ -219,7 +218,7 @@ class Decryptor(ECDHKeyHandler):
 
     def __exit__(self, exc_type, exc_value, tb):
         if exc_type is not None:
-            traceback.print_exception(exc_type, exc_value, tb)
+            LOG.error("Decryption failed", exc_info=(exc_type, exc_value, tb))
             return False  # uncomment to pass exception through
 
         return True
@@ -267,7 +266,7 @@ class Decryptor(ECDHKeyHandler):
                 LOG.debug("Testing nonce...")
                 if last_nonce != nonce:
                     raise SystemExit("Nonces do not match!!")
-                LOG.debug(f"Last nonce should be: {last_nonce}, was: {nonce}")
+                LOG.debug("Last nonce should be: %s, was: %s", last_nonce, nonce)
         except Exception as err:
             LOG.warning(str(err))
         finally:
@@ -5,13 +5,13 @@
 ###############################################################################
 
 # Standard library
-import json
 import logging
 import os
 import pathlib
 import textwrap
 
 # Installed
+import orjson
 import rich
 
 # Own modules
@@ -37,22 +37,26 @@ class FileHandler:
 
         # Get user specified data
         self.local_destination = local_destination
-        self.data_list = []
+        # Duplicates are removed as the paths are collected
+        self.data_list = set()
         if source is not None:
-            self.data_list += list(source)
+            self.data_list.update(source)
         if source_path_file is not None:
             source_path_file = pathlib.Path(source_path_file)
             if source_path_file.exists():
                 try:
                     original_umask = os.umask(0)  # User file-creation mode mask
                     with source_path_file.resolve().open(mode="r") as spf:
-                        self.data_list += spf.read().splitlines()
+                        # Stream the lines instead of reading the whole file, skip blank lines
+                        self.data_list.update(
+                            path for path in (line.rstrip("\n") for line in spf) if path.strip()
+                        )
                 except OSError as err:
                     dds_cli.utils.console.print(
                         f"Failed to get files from source-path-file option: {err}"
                     )
                     os.umask(original_umask)
-                    os._exit(1)
+                    dds_cli.utils.exit_now(1)
                 finally:
                     os.umask(original_umask)
 
@@ -71,9 +75,8 @@ class FileHandler:
         # Open config file and get contents
         try:
             original_umask = os.umask(0)
-            with configpath.open(mode="r") as cfp:
-                contents = json.load(cfp)
-        except json.decoder.JSONDecodeError as err:
+            contents = orjson.loads(configpath.read_bytes())
+        except orjson.JSONDecodeError as err:
             raise dds_cli.exceptions.ConfigFileExtractionError(
                 filepath=configpath, caught_exception=err
             )
@@ -86,12 +89,8 @@ class FileHandler:
     def save_errors_to_file(file: pathlib.Path, info):
         try:
             original_umask = os.umask(0)  # User file-creation mode mask
-            with file.open(mode="w") as errfile:
-                json.dump(
-                    info,
-                    errfile,
-                    indent=4,
-                )
+            # Any non-JSON values, e.g. paths, are written as strings
+            file.write_bytes(orjson.dumps(info, default=str, option=orjson.OPT_INDENT_2))
         except (OSError, TypeError) as err:
             LOG.warning(str(err))
         finally:
@@ -114,16 +113,11 @@ class FileHandler:
         if not get_single_files:
             columns = ["Directory"] + columns
 
-        files = [
-            x
-            for x in all_failed_data
-            if (
-                get_single_files
-                and x[1]["subpath"] == "."
-                or not get_single_files
-                and x[1]["subpath"] != "."
-            )
-        ]
+        files = [x for x in all_failed_data if (x[1]["subpath"] == ".") == get_single_files]
+
+        # Nothing to display
+        if not files:
+            return curr_table, ""
 
         additional_message = (
             (
@@ -131,66 +125,48 @@ class FileHandler:
                 "To ignore issues with other files, remove the `--break-on-fail` "
                 "flag from the call."
             )
-            if any([1 for x in files if "break-on-fail" in x[1]["message"]])
+            if any("break-on-fail" in x[1]["message"] for x in files)
             else ""
         )
 
-        if files:
-            curr_table = rich.table.Table(
-                title=f"Incomplete {title} {up_or_down}s",
-                title_justify="left",
-                show_header=True,
-                header_style="bold",
-            )
+        curr_table = rich.table.Table(
+            title=f"Incomplete {title} {up_or_down}s",
+            title_justify="left",
+            show_header=True,
+            header_style="bold",
+        )
+
+        for x in columns:
+            curr_table.add_column(x, overflow="fold")
 
-            for x in columns:
-                curr_table.add_column(x, overflow="fold")
+        subpath = ""
+        for file, info in files:
+            # Files cancelled due to --break-on-fail are explained by the additional message
+            message = info["message"] if "break-on-fail" not in info["message"] else ""
 
             if get_single_files:
                 if upload:
-                    _ = [
-                        curr_table.add_row(
-                            textwrap.fill(x[1]["path_raw"]),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
-                        )
-                        for x in files
-                    ]
+                    curr_table.add_row(textwrap.fill(info["path_raw"]), message)
                 else:
-                    _ = [
-                        curr_table.add_row(
-                            x[1]["name_in_db"],
-                            textwrap.fill(x[0]),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
-                        )
-                        for x in files
-                    ]
+                    curr_table.add_row(info["name_in_db"], textwrap.fill(file), message)
             else:
-                subpath = ""
+                # Only display the directory for the first file in it
                 if upload:
-                    for x in files:
-                        curr_table.add_row(
-                            textwrap.fill(
-                                ""
-                                if subpath == x[1]["subpath"]
-                                else str(pathlib.Path(x[1]["path_raw"]).parent)
-                            ),
-                            str(pathlib.Path(x[1]["path_raw"]).name),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
-                        )
-
-                        subpath = x[1]["subpath"]
+                    path_raw = pathlib.Path(info["path_raw"])
+                    curr_table.add_row(
+                        textwrap.fill("" if subpath == info["subpath"] else str(path_raw.parent)),
+                        str(path_raw.name),
+                        message,
+                    )
                 else:
-                    for x in files:
-                        curr_table.add_row(
-                            ""
-                            if subpath == x[1]["subpath"]
-                            else str(pathlib.Path(x[1]["subpath"])),
-                            x[1]["name_in_db"],
-                            textwrap.fill(str(pathlib.Path(x[0]))),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
-                        )
+                    curr_table.add_row(
+                        "" if subpath == info["subpath"] else str(pathlib.Path(info["subpath"])),
+                        info["name_in_db"],
+                        textwrap.fill(str(pathlib.Path(file))),
+                        message,
+                    )
 
-                        subpath = x[1]["subpath"]
+                subpath = info["subpath"]
 
         return curr_table, additional_message
 
@@ -5,16 +5,18 @@
 ###############################################################################
 
 # Standard library
+import concurrent.futures
 import hashlib
 import logging
 import os
 import pathlib
+import stat
 import uuid
 
 # Installed
+import orjson
 import requests
 import rich
-import simplejson
 import zstandard as zstd
 
 # Own modules
@@ -49,13 +51,17 @@ class LocalFileHandler(fh.FileHandler):
         # Initiate FileHandler from inheritance
         super().__init__(user_input=user_input, local_destination=temporary_destination)
 
-        # Remove duplicates and save all files for later use
-        all_files = set(self.data_list)
+        # Get absolute paths for all data - resolving fails if the path does not exist,
+        # goes through a file (NotADirectoryError) or is a symlink loop (RuntimeError).
+        # Paths are deduplicated after resolving, so the same file given in
+        # different ways is only collected once
+        resolved_paths, non_existent_files = set(), set()
+        for path in self.data_list:
+            try:
+                resolved_paths.add(pathlib.Path(path).resolve(strict=True))
+            except (OSError, RuntimeError):
+                non_existent_files.add(path)
 
-        # Remove non existent files
-        self.data_list = {x for x in self.data_list if pathlib.Path(x).exists()}
-
-        non_existent_files = all_files.difference(self.data_list)
         if len(non_existent_files) > 0:
             # Issue warning that some of the files don't exist
             LOG.warning(
@@ -64,15 +70,14 @@ class LocalFileHandler(fh.FileHandler):
                 )
             )
 
-        # Get absolute paths for all data
-        self.data_list = [pathlib.Path(path).resolve() for path in self.data_list]
+        self.data_list = list(resolved_paths)
 
         # No data -- cannot proceed
         if not self.data_list:
             dds_cli.utils.console.print("\n:warning: No data specified. :warning:\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
-        self.data, _ = self.__collect_file_info_local(all_paths=self.data_list)
+        self.data = self.__collect_file_info_local(all_paths=self.data_list)
         self.data_list = None
 
         LOG.debug("File info computed/collected")
@@ -102,51 +107,93 @@ class LocalFileHandler(fh.FileHandler):
             os.umask(original_umask)
 
     # Private methods ############ Private methods #
-    def __collect_file_info_local(self, all_paths, folder=pathlib.Path(""), task_name=""):
+    def __collect_file_info_local(self, all_paths):
         """Get info on each file in each path specified."""
 
-        file_info = dict()
-        progress_tasks = dict()
+        # Checking for compression requires reading the start of each file,
+        # so the file info is collected in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=32) as texec:
+            info_futures = [
+                texec.submit(self.__get_file_info_local, file=file, folder=folder, size=size)
+                for file, folder, size in self.__find_files_local(all_paths=all_paths)
+            ]
+            file_info = dict(fut.result() for fut in info_futures)
+
+        return file_info
+
+    def __find_files_local(self, all_paths):
+        """Find all files in the paths specified, the folder each file is in and its size."""
+
         for path in all_paths:
-            task_name = path.name if folder == pathlib.Path("") else task_name
-            # Get info for all files
-            # and feed back to same function for all folders
-            if path.is_file():
-                with fc.Compressor() as compressor:
-                    is_compressed, error = compressor.is_compressed(file=path)
-
-                    if error != "":
-                        LOG.exception(error)
-                        os._exit(1)
-
-                    path_processed = self.create_encrypted_name(
-                        raw_file=path,
-                        subpath=folder,
-                        no_compression=is_compressed,
+            # One stat call gives both the type and the size
+            path_stat = path.stat()
+            if stat.S_ISREG(path_stat.st_mode):
+                yield path, pathlib.Path(""), path_stat.st_size
+            elif stat.S_ISDIR(path_stat.st_mode):
+                yield from self.__scan_directory(directory=path, folder=pathlib.Path(path.name))
+
+    def __scan_directory(self, directory, folder):
+        """Find all files in a directory and its subdirectories.
+
+        os.scandir gets the file type when listing the directory, so no
+        additional stat call is needed to check each entry.
+        """
+
+        # Unreadable directories are skipped
+        try:
+            entries = os.scandir(directory)
+        except OSError as err:
+            LOG.warning("Skipping directory '%s': %s", directory, err)
+            return
+
+        with entries:
+            for entry in entries:
+                # Skip entries which cannot be checked, e.g. symlink loops
+                try:
+                    is_file = entry.is_file()
+                    is_dir = not is_file and entry.is_dir()
+                    size = entry.stat().st_size if is_file else None
+                except OSError as err:
+                    LOG.warning("Skipping '%s': %s", entry.path, err)
+                    continue
+
+                # Get all files and feed back to same function for all folders
+                if is_file:
+                    yield pathlib.Path(entry.path), folder, size
+                elif is_dir:
+                    yield from self.__scan_directory(
+                        directory=entry.path, folder=folder / pathlib.Path(entry.name)
                     )
 
-                    file_info[str(folder / path.name)] = {
-                        "path_raw": path,
-                        "subpath": folder,
-                        "size_raw": path.stat().st_size,
-                        "compressed": is_compressed,
-                        "path_processed": path_processed,
-                        "size_processed": 0,
-                        "path_remote": self.generate_bucket_filepath(
-                            filename=path_processed.name, folder=folder
-                        ),
-                        "overwrite": False,
-                        "checksum": "",
-                    }
-
-            elif path.is_dir():
-                content_info, _ = self.__collect_file_info_local(
-                    all_paths=path.glob("*"),
-                    folder=folder / pathlib.Path(path.name),
-                )
-                file_info.update({**content_info})
+    def __get_file_info_local(self, file, folder, size):
+        """Get info on a single file."""
+
+        with fc.Compressor() as compressor:
+            is_compressed, error = compressor.is_compressed(file=file)
+
+            if error != "":
+                LOG.exception(error)
+                dds_cli.utils.exit_now(1)
+
+            path_processed = self.create_encrypted_name(
+                raw_file=file,
+                subpath=folder,
+                no_compression=is_compressed,
+            )
 
-        return file_info, progress_tasks
+            return str(folder / file.name), {
+                "path_raw": file,
+                "subpath": folder,
+                "size_raw": size,
+                "compressed": is_compressed,
+                "path_processed": path_processed,
+                "size_processed": 0,
+                "path_remote": self.generate_bucket_filepath(
+                    filename=path_processed.name, folder=folder
+                ),
+                "overwrite": False,
+                "checksum": "",
+            }
 
     # Public methods ############## Public methods #
     def create_upload_status_dict(self, existing_files, overwrite=False):
@@ -210,18 +257,18 @@ class LocalFileHandler(fh.FileHandler):
 
         if not response.ok:
             dds_cli.utils.console.print(f"\n{response.text}\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         try:
-            files_in_db = response.json()
-        except simplejson.JSONDecodeError as err:
+            files_in_db = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             LOG.warning(err)
             raise SystemExit from err
 
         # API failure
         if "files" not in files_in_db:
             dds_cli.utils.console.print("\n:warning: Files not returned from API. :warning:\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         LOG.debug("Previous upload check finished.")
 
@@ -10,6 +10,7 @@ import os
 import pathlib
 
 # Installed
+import orjson
 import requests
 import rich
 
@@ -41,11 +42,11 @@ class RemoteFileHandler(fh.FileHandler):
 
         self.get_all = get_all
 
-        self.data_list = list(set(self.data_list))
+        self.data_list = list(self.data_list)
 
         if not self.data_list and not get_all:
             dds_cli.utils.console.print("\n:warning: No data specified. :warning:\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         self.data = self.__collect_file_info_remote(all_paths=self.data_list, token=token)
         self.data_list = None
@@ -89,15 +90,15 @@ class RemoteFileHandler(fh.FileHandler):
             )
         except requests.ConnectionError as err:
             LOG.fatal(err)
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         # Server error or error in response
         if not response.ok:
             dds_cli.utils.console.print(f"\n{response.text}\n")
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         # Get file info from response
-        file_info = response.json()
+        file_info = orjson.loads(response.content)
 
         # Folder info required if specific files requested
         if all_paths and "folders" not in file_info:
@@ -105,14 +106,14 @@ class RemoteFileHandler(fh.FileHandler):
                 "\n:warning: Error in response. "
                 "Not enough info returned despite ok request. :warning:\n"
             )
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         # Files in response always required
         if "files" not in file_info:
             dds_cli.utils.console.print(
                 "\n:warning: No files in response despite ok request. :warning:\n"
             )
-            os._exit(1)
+            dds_cli.utils.exit_now(1)
 
         # files and files in folders from db
         files = file_info["files"]
@@ -128,10 +129,10 @@ class RemoteFileHandler(fh.FileHandler):
         # Save info on files in dict and return
         data = {
             self.local_destination
-            / pathlib.Path(x): {
+            / x: {
                 **y,
                 "name_in_db": x,
-                "path_downloaded": self.local_destination / pathlib.Path(y["name_in_bucket"]),
+                "path_downloaded": self.local_destination / y["name_in_bucket"],
             }
             for x, y in files.items()
         }
@@ -141,10 +142,10 @@ class RemoteFileHandler(fh.FileHandler):
             data.update(
                 {
                     self.local_destination
-                    / pathlib.Path(z[0]): {
+                    / z[0]: {
                         "name_in_db": z[0],
                         "name_in_bucket": z[1],
-                        "path_downloaded": self.local_destination / pathlib.Path(z[1]),
+                        "path_downloaded": self.local_destination / z[1],
                         "subpath": z[2],
                         "size": z[3],
                         "size_encrypted": z[4],
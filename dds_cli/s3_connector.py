@@ -7,19 +7,19 @@
 # Standard library
 import dataclasses
 import logging
-import os
 import requests
 import sys
-import traceback
 
 # Installed
+import boto3.s3.transfer
 import botocore
+import orjson
 import rich
-import simplejson
 
 # Own modules
 from dds_cli import DDSEndpoint
 from dds_cli.cli_decorators import connect_cloud
+import dds_cli.utils
 
 ###############################################################################
 # LOGGING ########################################################### LOGGING #
@@ -42,6 +42,7 @@ class S3Connector:
     keys: dict = dataclasses.field(init=False)
     url: str = dataclasses.field(init=False)
     bucketname: str = dataclasses.field(init=False)
+    transfer_config: boto3.s3.transfer.TransferConfig = dataclasses.field(init=False)
     resource = None
 
     def __post_init__(self, project_id, token):
@@ -54,13 +55,19 @@ class S3Connector:
             self.message,
         ) = self.get_s3_info(project_id=project_id, token=token)
 
+        # boto3 already transfers files above 8 MiB in up to 10 parallel parts -
+        # larger parts than the default 8 MiB mean fewer requests per file
+        self.transfer_config = boto3.s3.transfer.TransferConfig(
+            multipart_chunksize=16 * 1024 * 1024
+        )
+
     @connect_cloud
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
         if exc_type is not None:
-            traceback.print_exception(exc_type, exc_value, tb)
+            LOG.error("Error while connected to S3", exc_info=(exc_type, exc_value, tb))
             return False  # uncomment to pass exception through
 
         return True
@@ -93,8 +100,8 @@ class S3Connector:
 
         # Get s3 info
         try:
-            s3info = response.json()
-        except simplejson.JSONDecodeError as err:
+            s3info = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             raise SystemExit from err
 
         if any(value is None for value in s3info.values()):
@@ -131,12 +138,12 @@ class S3Connector:
             LOG.error(
                 f"Invalid bucket name length. Must be between 3 and 63 characters, found {bnlen}"
             )
-            os._exit(0)
+            dds_cli.utils.exit_now(0)
 
         if "_" in self.bucketname:
             # Add custom exception
             LOG.error(f"Invalid bucket name characters. Cannot contain underscores.")
-            os._exit(0)
+            dds_cli.utils.exit_now(0)
 
         bucketnamefirst = list(self.bucketname)[0]
         if not (bucketnamefirst.islower() or bucketnamefirst.isdigit()):
@@ -144,7 +151,7 @@ class S3Connector:
             LOG.error(
                 f"Invalid first character. Must be digit or lowercase letter, found '{bucketnamefirst}'",
             )
-            os._exit(0)
+            dds_cli.utils.exit_now(0)
 
     def create_bucket(self):
         """Creates the bucket"""
@@ -160,7 +167,7 @@ class S3Connector:
         bucket_exists = self.check_bucket_exists()
         if not bucket_exists:
             print(f"Bucket '{self.bucketname}' does not exist. Failed second attempt.")
-            os._exit(0)
+            dds_cli.utils.exit_now(0)
         LOG.info(f"Bucket '{self.bucketname}' created!")
 
         return True
@@ -7,6 +7,8 @@
 # Standard library
 import logging
 import itertools
+import threading
+import time
 
 # Installed
 import boto3
@@ -59,9 +61,35 @@ class ProgressPercentage(object):
         self.progress = progress
         self.task = task
 
+        # The bar is only updated when enough has changed, see __call__
+        total = next((x.total for x in progress.tasks if x.id == task), None)
+        self._total = total or 0
+        self._min_advance = self._total / 100
+        self._min_interval = 0.25  # seconds
+
         self._seen_so_far = 0
+        self._not_shown = 0
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
 
     def __call__(self, bytes_amount, **_):
 
-        self._seen_so_far += bytes_amount
-        self.progress.update(self.task, advance=bytes_amount)
+        # Called from the boto3 transfer threads, once per chunk - only update the bar
+        # if at least 1 % or 250 ms has passed since the last update, or if finished
+        with self._lock:
+            self._seen_so_far += bytes_amount
+            self._not_shown += bytes_amount
+
+            now = time.monotonic()
+            if (
+                self._not_shown < self._min_advance
+                and now - self._last_update < self._min_interval
+                and self._seen_so_far < self._total
+            ):
+                return
+
+            advance, self._not_shown = self._not_shown, 0
+            self._last_update = now
+
+        # Progress has a lock of its own - no need to hold ours while rendering
+        self.progress.update(self.task, advance=advance)
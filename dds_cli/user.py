@@ -9,10 +9,10 @@ import dataclasses
 import logging
 import os
 import requests
-import simplejson
 import inspect
 
 # Installed
+import orjson
 import rich
 
 # Own modules
@@ -69,8 +69,8 @@ class User:
 
         # Get response from api
         try:
-            response_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            response_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
             LOG.exception(str(err))
             raise
 
@@ -1,4 +1,29 @@
+import logging
+import os
+
 import rich.console
 
 console = rich.console.Console(stderr=True)
 # console = rich.console.Console()
+
+
+def print_or_page(renderable, estimated_lines: int):
+    """Print the renderable, via a pager if it is taller than the visible terminal."""
+
+    if estimated_lines > console.height:
+        with console.pager():
+            console.print(renderable)
+    else:
+        console.print(renderable)
+
+
+def exit_now(code: int = 1):
+    """Write any buffered log records, e.g. for --log-file, and exit immediately.
+
+    os._exit skips the logging shutdown which would otherwise flush the buffer.
+    """
+
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+    os._exit(code)
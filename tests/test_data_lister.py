@@ -1,10 +1,14 @@
 # IMPORTS ################################################################################ IMPORTS #
 # Standard library
+import io
 
 # Installed
+import orjson
 import pytest
+import rich.console
 
 # Own modules
+import dds_cli.utils
 from dds_cli import data_lister
 from dds_cli import exceptions
 
@@ -66,3 +70,154 @@ def test_datalister_listprojects(monkeypatch):
     datalister_object = data_lister.DataLister(username="username")
 
     datalister_object.list_projects()
+
+
+# DataLister.sort_projects
+PROJECTS = [
+    {"Project ID": "p3", "Status": "In Progress", "Last updated": "2021-01-02"},
+    {"Project ID": "p1", "Status": "Available", "Last updated": None},
+    {"Project ID": "p4", "Status": None, "Last updated": "2021-01-01"},
+    {"Project ID": "p2", "Status": "In Progress", "Last updated": "2021-01-02"},
+    {"Project ID": "p5", "Status": "Available", "Last updated": None},
+]
+
+
+def sorted_ids(sort_by, projects=PROJECTS):
+    """Sort the projects without authenticating and return the project IDs in order"""
+
+    datalister_object = data_lister.DataLister.__new__(data_lister.DataLister)
+    datalister_object.show_usage = False
+
+    return [x["Project ID"] for x in datalister_object.sort_projects(projects, sort_by=sort_by)]
+
+
+def test_datalister_sortprojects_id():
+    """Projects should be sorted according to ID, also if the option is unknown"""
+
+    assert sorted_ids("id") == ["p1", "p2", "p3", "p4", "p5"]
+    assert sorted_ids("nosuchcolumn") == ["p1", "p2", "p3", "p4", "p5"]
+
+
+def test_datalister_sortprojects_ties_sorted_by_id():
+    """Ties should be sorted according to ID and missing values placed last"""
+
+    assert sorted_ids("Status") == ["p1", "p5", "p2", "p3", "p4"]
+
+
+def test_datalister_sortprojects_updated_descending():
+    """Last updated should be sorted in descending order with ties sorted according to ID"""
+
+    assert sorted_ids("updated") == ["p1", "p5", "p2", "p3", "p4"]
+    assert sorted_ids("updated", projects=PROJECTS[::-1]) == ["p1", "p5", "p2", "p3", "p4"]
+
+
+def test_datalister_sortprojects_usage_without_flag():
+    """Sorting by usage without the --usage flag should sort by last updated"""
+
+    assert sorted_ids("usage") == sorted_ids("updated")
+
+
+# DataLister.list_recursive
+PROJECT_TREE = {
+    None: [("file.txt", False, "1.2 MB"), ("dir1", True, "5 KB"), ("another_dir", True, "3 GB")],
+    "dir1": [
+        ("b.txt", False, "12 B"),
+        ("subdir", True, "1 KB"),
+        ("long_file_name.fastq", False, "100.5 MB"),
+    ],
+    "dir1/subdir": [("c.txt", False, "1 KB")],
+    "another_dir": [("x", False, "3 GB")],
+}
+
+
+class ProjectTreeResponse:
+    """Response from the files listing for one folder in the project tree"""
+
+    def __init__(self, files_folders):
+        self.content = orjson.dumps(
+            {
+                "files_folders": [
+                    {"name": name, "folder": folder, "size": size}
+                    for name, folder, size in files_folders
+                ]
+            }
+        )
+
+
+class ProjectTreeSession:
+    """Session answering the files listing from a project tree, keeping track of the folders"""
+
+    def __init__(self, project_tree):
+        self.project_tree = project_tree
+        self.requested = []
+
+    def get(self, url, params):
+        self.requested.append(params["subpath"])
+        return ProjectTreeResponse(self.project_tree[params["subpath"]])
+
+
+def list_recursive(monkeypatch, project_tree=PROJECT_TREE, show_size=False):
+    """List the project tree without authenticating and return the printed lines"""
+
+    output = io.StringIO()
+    monkeypatch.setattr(
+        dds_cli.utils,
+        "console",
+        rich.console.Console(file=output, width=100, height=1000, color_system=None),
+    )
+
+    datalister_object = data_lister.DataLister.__new__(data_lister.DataLister)
+    datalister_object.session = ProjectTreeSession(project_tree)
+    datalister_object.project = "project_1"
+
+    datalister_object.list_recursive(show_size=show_size)
+
+    return datalister_object.session, [
+        x.rstrip() for x in output.getvalue().splitlines() if x.strip()
+    ]
+
+
+def test_datalister_listrecursive(monkeypatch):
+    """All folders should be listed once and the tree sorted by name"""
+
+    session, lines = list_recursive(monkeypatch)
+
+    assert sorted(session.requested, key=str) == sorted(PROJECT_TREE, key=str)
+    assert lines == [
+        " Files & directories in project: project_1/",
+        " ├── another_dir/",
+        " │   └── x",
+        " ├── dir1/",
+        " │   ├── b.txt",
+        " │   ├── long_file_name.fastq",
+        " │   └── subdir/",
+        " │       └── c.txt",
+        " └── file.txt",
+    ]
+
+
+def test_datalister_listrecursive_show_size(monkeypatch):
+    """The sizes should be aligned over the whole tree"""
+
+    _, lines = list_recursive(monkeypatch, show_size=True)
+
+    assert lines == [
+        " Files & directories in project: project_1/",
+        " ├── another_dir/",
+        " │   └── x                       3     GB",
+        " ├── dir1/",
+        " │   ├── b.txt                   12      B",
+        " │   ├── long_file_name.fastq    100.5     MB",
+        " │   └── subdir/",
+        " │       └── c.txt               1     KB",
+        " └── file.txt                    1.2     MB",
+    ]
+
+
+def test_datalister_listrecursive_empty_folder(monkeypatch):
+    """An empty folder should result in raised no data exception"""
+
+    with pytest.raises(exceptions.NoDataError) as nodataerr:
+        _ = list_recursive(monkeypatch, project_tree={**PROJECT_TREE, "dir1/subdir": []})
+
+    assert "dir1/subdir" in str(nodataerr.value)
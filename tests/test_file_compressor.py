@@ -0,0 +1,60 @@
+# IMPORTS ################################################################################ IMPORTS #
+
+# Standard library
+import os
+
+# Installed
+import pytest
+
+# Own modules
+from dds_cli import file_compressor
+
+# TESTS #################################################################################### TESTS #
+# is_compressed
+
+
+@pytest.mark.parametrize("magic", list(file_compressor.MAGIC_DICT))
+def test_compressor_is_compressed_known_formats(tmp_path, magic):
+    """Files starting with a known signature should be seen as compressed"""
+
+    compressed_file = tmp_path / "compressed"
+    compressed_file.write_bytes(magic + b"some data")
+
+    with file_compressor.Compressor() as compressor:
+        assert compressor.is_compressed(file=compressed_file) == (True, "")
+
+
+def test_compressor_is_compressed_plain_file(tmp_path):
+    """Files without a known signature should not be seen as compressed"""
+
+    plain_file = tmp_path / "plain.txt"
+    plain_file.write_bytes(b"Not compressed")
+
+    with file_compressor.Compressor() as compressor:
+        assert compressor.is_compressed(file=plain_file) == (False, "")
+
+
+def test_compressor_is_compressed_nosuchfile(tmp_path):
+    """Non existent file should return an error"""
+
+    with file_compressor.Compressor() as compressor:
+        compressed, error = compressor.is_compressed(file=tmp_path / "nosuchfile")
+
+    assert not compressed
+    assert error != ""
+
+
+def test_compressor_is_compressed_keeps_umask(tmp_path):
+    """Checking a file should not change the process wide umask"""
+
+    plain_file = tmp_path / "plain.txt"
+    plain_file.write_bytes(b"Not compressed")
+
+    original_umask = os.umask(0o022)
+    try:
+        with file_compressor.Compressor() as compressor:
+            compressor.is_compressed(file=plain_file)
+
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(original_umask)
@@ -4,6 +4,7 @@
 import pathlib
 
 # Installed
+import orjson
 import pytest
 
 # Own modules
@@ -51,3 +52,66 @@ def test_filehandler_extract_config_with_fields():
         "password": "test_password",
         "project": "test_project",
     }
+
+
+# create_summary_table
+FAILED_UPLOADS = [
+    ("file1.txt", {"path_raw": "/data/file1.txt", "subpath": ".", "message": "Failed"}),
+    (
+        "dir/file2.txt",
+        {"path_raw": "/data/dir/file2.txt", "subpath": "dir", "message": "Failed"},
+    ),
+    (
+        "dir/file3.txt",
+        {
+            "path_raw": "/data/dir/file3.txt",
+            "subpath": "dir",
+            "message": "'--break-on-fail'. File causing failure: 'file1.txt'. ",
+        },
+    ),
+]
+
+
+def test_filehandler_create_summary_table_single_files():
+    """Only files in the root should be in the table of single files"""
+
+    table, additional_message = file_handler.FileHandler.create_summary_table(
+        all_failed_data=FAILED_UPLOADS
+    )
+    assert table.row_count == 1
+    assert additional_message == ""
+
+
+def test_filehandler_create_summary_table_directories():
+    """Files in directories should be in the directory table, with break-on-fail info"""
+
+    table, additional_message = file_handler.FileHandler.create_summary_table(
+        all_failed_data=FAILED_UPLOADS, get_single_files=False
+    )
+    assert table.row_count == 2
+    assert [x.header for x in table.columns] == ["Directory", "File", "Error"]
+    assert "--break-on-fail" in additional_message
+
+
+def test_filehandler_create_summary_table_no_files():
+    """No failed files should not result in a table"""
+
+    table, additional_message = file_handler.FileHandler.create_summary_table(
+        all_failed_data=FAILED_UPLOADS[:1], get_single_files=False
+    )
+    assert table is None
+    assert additional_message == ""
+
+
+# save_errors_to_file
+
+
+def test_filehandler_save_errors_to_file_paths(tmp_path):
+    """Path values in the failed file info should be saved as strings"""
+
+    outfile = tmp_path / "dds_failed_delivery.txt"
+    file_handler.FileHandler.save_errors_to_file(
+        file=outfile, info={"file.txt": {"path_raw": pathlib.Path("dir/file.txt")}}
+    )
+
+    assert orjson.loads(outfile.read_bytes()) == {"file.txt": {"path_raw": "dir/file.txt"}}
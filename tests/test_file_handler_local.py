@@ -0,0 +1,65 @@
+# IMPORTS ################################################################################ IMPORTS #
+
+# Own modules
+from dds_cli import file_handler_local
+
+# TESTS #################################################################################### TESTS #
+# LocalFileHandler
+
+
+def test_localfilehandler_skips_invalid_paths(tmp_path):
+    """Paths that cannot be resolved should be skipped and the valid ones collected"""
+
+    good_file = tmp_path / "file.txt"
+    good_file.write_bytes(b"Some data")
+
+    loop = tmp_path / "loop"
+    loop.symlink_to(loop)
+
+    filehandler = file_handler_local.LocalFileHandler(
+        user_input=((str(good_file), str(good_file / "foo"), str(loop)), None),
+        temporary_destination=tmp_path,
+    )
+
+    assert list(filehandler.data) == ["file.txt"]
+
+
+def test_localfilehandler_skips_symlink_loop_in_directory(tmp_path):
+    """A symlink loop inside a source directory should be skipped and the files collected"""
+
+    source_dir = tmp_path / "d"
+    source_dir.mkdir()
+    (source_dir / "a.txt").write_bytes(b"Some data")
+    (source_dir / "loop").symlink_to(source_dir / "loop")
+
+    filehandler = file_handler_local.LocalFileHandler(
+        user_input=((str(source_dir),), None),
+        temporary_destination=tmp_path,
+    )
+
+    assert list(filehandler.data) == ["d/a.txt"]
+
+
+def test_localfilehandler_source_path_file(tmp_path, caplog):
+    """Blank lines in the source path file should be skipped and duplicates collected once"""
+
+    (tmp_path / "file1.txt").write_bytes(b"Some data")
+    (tmp_path / "file2.txt").write_bytes(b"Some more data")
+
+    path_file = tmp_path / "paths.txt"
+    path_file.write_text(
+        f"{tmp_path / 'file1.txt'}\n"
+        "\n"
+        "   \n"
+        f"{tmp_path / 'file2.txt'}\r\n"
+        f"{tmp_path / 'file1.txt'}\n"
+        f"{tmp_path}/./file1.txt\n"
+        "\t\n"
+    )
+
+    filehandler = file_handler_local.LocalFileHandler(
+        user_input=(None, str(path_file)), temporary_destination=tmp_path
+    )
+
+    assert sorted(filehandler.data) == ["file1.txt", "file2.txt"]
+    assert "does not exist" not in caplog.text
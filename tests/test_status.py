@@ -0,0 +1,43 @@
+# IMPORTS ################################################################################ IMPORTS #
+
+# Standard library
+import threading
+
+# Installed
+from rich.progress import Progress
+
+# Own modules
+from dds_cli import status
+
+# TESTS #################################################################################### TESTS #
+# ProgressPercentage
+
+
+def test_progress_percentage_reaches_total():
+    """All transferred bytes should be shown, also when called from several threads"""
+
+    with Progress(disable=True) as progress:
+        task = progress.add_task("Upload", total=4 * 1000 * 1000)
+        callback = status.ProgressPercentage(progress=progress, task=task)
+
+        threads = [
+            threading.Thread(target=lambda: [callback(1000) for _ in range(1000)]) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert progress.tasks[0].completed == 4 * 1000 * 1000
+
+
+def test_progress_percentage_throttled():
+    """Small chunks should not update the progress bar every time"""
+
+    with Progress(disable=True) as progress:
+        task = progress.add_task("Upload", total=1000 * 1000)
+        callback = status.ProgressPercentage(progress=progress, task=task)
+
+        callback(10)
+
+        assert progress.tasks[0].completed == 0